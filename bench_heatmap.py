@@ -0,0 +1,70 @@
+# TIE-02101: Johdatus ohjelmointiin
+# Joona Perasto
+# Mittaa lämpökartan päivityksen keston siirtoa kohden ilman
+# käyttöliittymää.
+#
+# Ajetaan komennolla: python bench_heatmap.py
+
+
+import random
+import time
+from heatmap import HeatMap
+
+
+BOARD_SIZES = [12, 50]
+MOVES = 100
+SEED = 272725
+
+
+def bench(size, moves):
+    """Play random moves on size x size board, time incremental and full.
+
+    :param size: int, board width and height
+    :param moves: int, how many moves to play
+    :return: (float, float) mean seconds per move: incremental, full rebuild
+    """
+    rng = random.Random(SEED)
+    tiles = [(x, y) for y in range(size) for x in range(size)]
+    rng.shuffle(tiles)
+    tiles = tiles[:moves]
+
+    players = ("x", "o")
+    incremental = HeatMap(players, size_x=size, size_y=size)
+    full = HeatMap(players, size_x=size, size_y=size)
+    board = [[None for _x in range(size)] for _y in range(size)]
+
+    incremental_time = 0.0
+    full_time = 0.0
+    for turn, (x, y) in enumerate(tiles):
+        mark = players[turn % 2]
+
+        start = time.perf_counter()
+        incremental.place(x, y, mark)
+        incremental_time += time.perf_counter() - start
+
+        # Baseline: write the move, then recompute the whole board
+        start = time.perf_counter()
+        board[y][x] = mark
+        full.rebuild(board)
+        full_time += time.perf_counter() - start
+
+    # Both ways must end up with the same scores
+    for mark in players:
+        assert incremental.get_scores(mark) == full.get_scores(mark)
+
+    return incremental_time / len(tiles), full_time / len(tiles)
+
+
+def main():
+    print(f"{'board':>7} {'moves':>6} {'incremental':>13} {'full':>13} "
+          f"{'speedup':>8}")
+    for size in BOARD_SIZES:
+        moves = min(MOVES, size * size)
+        incremental, full = bench(size, moves)
+        print(f"{size:>3}x{size:<3} {moves:>6} "
+              f"{incremental * 1e6:>10.1f} us {full * 1e6:>10.1f} us "
+              f"{full / incremental:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+# TIE-02101: Johdatus ohjelmointiin
+# Joona Perasto
+# Tiedosto, joka sisältää siirtoehdotusten lämpökartan.
+#
+# Lämpökartta ei riipu käyttöliittymästä, joten sitä voi käyttää myös
+# ilman tkinteriä, esimerkiksi 'bench_heatmap.py' mittauksissa.
+
+
+from settings import Settings
+
+
+# Same 4 directions as Game.check_move: horizontal, vertical, 2 diagonals
+DIRECTIONS = [(1, 0), (0, 1), (1, 1), (1, -1)]
+
+# Open window with n own marks is worth HINT_WEIGHT ** n
+HINT_WEIGHT = 4
+
+# Placeholder for tiles outside the board, blocks every window it is in
+_OUTSIDE = object()
+
+
+def hint_level(score):
+    """Return rough magnitude of score: log4 rounded down, 0 for no score.
+
+    A window with k own marks alone gives level k. Several lines crossing
+    at a tile add up, so e.g. two open threes also reach level 4.
+
+    :param score: int, score from HeatMap
+    :return: int level, 0 for score 0
+    """
+    if score <= 0:
+        return 0
+    # Highest set bit is floor(log2), halving that gives floor(log4)
+    return (score.bit_length() - 1) // 2
+
+
+class HeatMap:
+    """Heuristic move-suggestion scores for every tile of the board.
+
+    Score of an empty tile is the line potential for a player: every window of
+    IN_A_ROW tiles through the tile in the 4 directions used by check_move,
+    that holds no opponent marks, adds HINT_WEIGHT ** (own marks in window).
+    Occupied tiles and tiles with only empty windows score 0.
+
+    Notable features:
+        HeatMap.place(x, y, mark) -> list
+            Place mark to x, y and recompute only the empty tiles within
+            IN_A_ROW - 1 of the move, and only along the line joining them
+            to the move. Return list of tuples (x, y) updated.
+
+        HeatMap.get_scores(mark) -> list[size_y][size_x]
+            Return score grid for the player mark.
+
+        HeatMap.rebuild(grid) -> void
+            Recompute every tile from scratch, for board grid if given.
+
+        HeatMap.reset() -> void
+            Clear the board and all scores.
+    """
+
+    def __init__(self, players, empty=None, size_x=Settings.SIZE_X,
+                 size_y=Settings.SIZE_Y, in_a_row=Settings.IN_A_ROW):
+        """Create empty board and zeroed score grids for all players.
+
+        :param players: marks to keep scores for, ex. (CROSS, CIRCLE)
+        :param empty: mark of an empty tile
+        :param size_x: int
+        :param size_y: int
+        :param in_a_row: int, how many marks in a row to win
+        """
+        self.__players = tuple(players)
+        self.__empty = empty
+        self.__size_x = size_x
+        self.__size_y = size_y
+        self.__in_a_row = in_a_row
+
+        self.__grid = None
+        self.__scores = None
+        self.__line_scores = None
+        self.reset()
+
+    def reset(self):
+        """Clear the board and all scores.
+
+        :return:
+        """
+        self.__grid = [[self.__empty for _x in range(self.__size_x)]
+                       for _y in range(self.__size_y)]
+
+        # Empty board has no own marks in any window, so everything is 0
+        self.__scores = {
+            player: [[0 for _x in range(self.__size_x)]
+                     for _y in range(self.__size_y)]
+            for player in self.__players
+        }
+
+        # Part of each score coming from each of DIRECTIONS, the score is
+        # their sum. A move changes only the part along the line to it.
+        self.__line_scores = {
+            player: [[[0 for _x in range(self.__size_x)]
+                      for _y in range(self.__size_y)]
+                     for _direction in DIRECTIONS]
+            for player in self.__players
+        }
+
+    def get_tile(self, x, y):
+        """Return mark at x, y, placeholder if out of bounds.
+
+        :param x: coord x
+        :param y: coord y
+        :return: mark at (x, y)
+        """
+        if x < 0 or x >= self.__size_x or y < 0 or y >= self.__size_y:
+            return _OUTSIDE
+        return self.__grid[y][x]
+
+    def get_score(self, x, y, mark):
+        """Return score of tile x, y for the player mark.
+
+        :param x: coord x
+        :param y: coord y
+        :param mark: player mark
+        :return: int score
+        """
+        return self.__scores[mark][y][x]
+
+    def get_scores(self, mark):
+        """Return score grid for the player mark.
+
+        The grid is updated in place by place, so it should not be modified.
+
+        :param mark: player mark
+        :return: list[size_y][size_x] of int scores
+        """
+        return self.__scores[mark]
+
+    def place(self, x, y, mark):
+        """Place mark to x, y and update the scores affected by it.
+
+        Only windows containing x, y change, and for a tile on one of the
+        4 lines through the move those windows all lie along that line. So
+        only the empty tiles within IN_A_ROW - 1 of the move are recomputed,
+        each in the direction of its line only.
+
+        :param x: int, the X coordinate of the move
+        :param y: int, the Y coordinate of the move
+        :param mark: mark to place
+        :return: list of tuples (x, y) whose scores were updated
+        """
+        self.__grid[y][x] = mark
+        self.__clear_tile(x, y)
+
+        updated = [(x, y)]
+        for line_index, direction in enumerate(DIRECTIONS):
+            for i in range(1, self.__in_a_row):
+                for sign in (-1, 1):
+                    coord_x = x + direction[0] * i * sign
+                    coord_y = y + direction[1] * i * sign
+
+                    # Occupied tiles score 0 anyway, nothing to update
+                    if self.get_tile(coord_x, coord_y) == self.__empty:
+                        self.__update_line(coord_x, coord_y, line_index)
+                        updated.append((coord_x, coord_y))
+
+        return updated
+
+    def rebuild(self, grid=None):
+        """Recompute every tile from scratch, optionally for a new board.
+
+        :param grid: list[size_y][size_x] of marks to copy, None keeps board
+        :return:
+        """
+        if grid is not None:
+            self.__grid = [list(row) for row in grid]
+
+        for y in range(self.__size_y):
+            for x in range(self.__size_x):
+                if self.__grid[y][x] != self.__empty:
+                    self.__clear_tile(x, y)
+                    continue
+
+                for line_index in range(len(DIRECTIONS)):
+                    self.__store_line(x, y, line_index)
+                self.__sum_tile(x, y)
+
+    def __clear_tile(self, x, y):
+        """Set all scores of occupied tile x, y to 0.
+
+        :param x: coord x
+        :param y: coord y
+        :return:
+        """
+        for player in self.__players:
+            for line_scores in self.__line_scores[player]:
+                line_scores[y][x] = 0
+            self.__scores[player][y][x] = 0
+
+    def __update_line(self, x, y, line_index):
+        """Recompute scores of tile x, y along one of DIRECTIONS.
+
+        :param x: coord x
+        :param y: coord y
+        :param line_index: int, index of the direction in DIRECTIONS
+        :return:
+        """
+        self.__store_line(x, y, line_index)
+        self.__sum_tile(x, y)
+
+    def __store_line(self, x, y, line_index):
+        """Score tile x, y along one direction, store the part per player.
+
+        :param x: coord x
+        :param y: coord y
+        :param line_index: int, index of the direction in DIRECTIONS
+        :return:
+        """
+        direction = DIRECTIONS[line_index]
+
+        # Tiles of the line through x, y, IN_A_ROW - 1 to both sides
+        line = [
+            self.get_tile(x + direction[0] * i, y + direction[1] * i)
+            for i in range(-self.__in_a_row + 1, self.__in_a_row)
+        ]
+
+        for player in self.__players:
+            score = 0
+            for start in range(self.__in_a_row):
+                window = line[start:start + self.__in_a_row]
+                count = window.count(player)
+
+                # Skip windows blocked by opponent or the board edge
+                if count + window.count(self.__empty) < self.__in_a_row:
+                    continue
+                if count > 0:
+                    score += HINT_WEIGHT ** count
+
+            self.__line_scores[player][line_index][y][x] = score
+
+    def __sum_tile(self, x, y):
+        """Set score of tile x, y to the sum of its parts per direction.
+
+        :param x: coord x
+        :param y: coord y
+        :return:
+        """
+        for player in self.__players:
+            self.__scores[player][y][x] = sum(
+                line_scores[y][x]
+                for line_scores in self.__line_scores[player])
@@ -10,11 +10,14 @@
 # tavallisessa pelissä erittäin epätodennäköistä.
 #
 # Halutessaan pelin asetuksia voi muuttaa 'settings.py' tiedostosta.
+# Vihjetila, joka värittää tyhjät ruudut siirtoehdotusten mukaan, vaihdetaan
+# päälle ja pois h-näppäimellä.
 
 
 from tkinter import *
 from enum import Enum
 from settings import *
+from heatmap import HeatMap, hint_level
 import winsound
 
 
@@ -110,6 +113,10 @@ class Tile(Label):
         Label.__init__(self, parent, *args, **kwargs)
         self.configure(bg=Color.MID_TONE)
 
+        # Color to return to when mouse leaves, changed by hint shading
+        self.__rest_color = Color.MID_TONE
+        self.__hovered = False
+
         # Helper to create mouse-event listeners for tiles, so they don't
         # trigger when game has ended.
         def create_marker_listener(func):
@@ -122,11 +129,17 @@ class Tile(Label):
         # Highlight tile when mouse is over it
         def mouse_over(_event):
             if game.get_tile(x, y) is MarkerType.NONE:
+                self.__hovered = True
                 self.configure(bg=Color.HIGH_TONE)
 
         # Return back to normal when mouse off
         def mouse_leave(_event):
-            self.configure(bg=Color.MID_TONE)
+            self.__hovered = False
+            self.configure(bg=self.__rest_color)
+
+        # Highlight is gone when mouse leaves even if the game has ended
+        def forget_hover(_event):
+            self.__hovered = False
 
         self.bind("<Enter>", create_marker_listener(mouse_over))
         self.bind("<Leave>", create_marker_listener(mouse_leave))
@@ -134,6 +147,19 @@ class Tile(Label):
             lambda _e: app.grid_clicked(x, y)))
         self.bind("<ButtonRelease-1>",
                   create_marker_listener(mouse_leave))
+        self.bind("<Leave>", forget_hover, add="+")
+
+    def set_rest_color(self, color):
+        """Set color the tile has when mouse is not over it.
+
+        Applied right away unless the tile is highlighted, then on leave.
+
+        :param color: string in color hex format, ex. "#FFFFFF"
+        :return:
+        """
+        self.__rest_color = color
+        if not self.__hovered:
+            self.configure(bg=color)
 
 
 class TileGrid(Frame):
@@ -159,6 +185,10 @@ class TileGrid(Frame):
 
         self.__tile_grid = create_grid(Settings.SIZE_X, Settings.SIZE_Y)
 
+        # Shade level of each tile, only changed levels are reconfigured
+        self.__hint_mode = Settings.HINTS
+        self.__hint_levels = create_grid(Settings.SIZE_X, Settings.SIZE_Y, 0)
+
         for y in range(Settings.SIZE_Y):
             # Remove ugly left border of grid
             if y == 0:
@@ -192,6 +222,65 @@ class TileGrid(Frame):
         for tile in tiles:
             self.set_tile_color(tile[0], tile[1], Color.WIN_COLOR)
 
+    def get_hint_mode(self):
+        """Return True if empty tiles are shaded by move suggestion.
+
+        :return: bool
+        """
+        return self.__hint_mode
+
+    def set_hint_mode(self, enabled):
+        """Enable or disable hint shading, disabling clears the shades.
+
+        :param enabled: bool
+        :return:
+        """
+        self.__hint_mode = enabled
+        if not enabled:
+            self.clear_hints()
+
+    def update_hints(self, scores):
+        """Shade tiles by move-suggestion scores if hint mode is enabled.
+
+        Only tiles whose shade changed are reconfigured.
+
+        :param scores: list[SIZE_Y][SIZE_X] of int scores, see HeatMap
+        :return:
+        """
+        if not self.__hint_mode:
+            return
+
+        top_level = len(Color.HINT_TONES) - 1
+        for y in range(Settings.SIZE_Y):
+            for x in range(Settings.SIZE_X):
+                level = min(hint_level(scores[y][x]), top_level)
+                if level != self.__hint_levels[y][x]:
+                    self.__hint_levels[y][x] = level
+                    self.__tile_grid[y][x].set_rest_color(
+                        Color.HINT_TONES[level])
+
+    def clear_hints(self):
+        """Remove hint shades from shaded tiles.
+
+        Tiles without a shade keep the color the game gave them.
+
+        :return:
+        """
+        for y in range(Settings.SIZE_Y):
+            for x in range(Settings.SIZE_X):
+                self.__clear_hint(x, y)
+
+    def __clear_hint(self, x, y):
+        """Remove hint shade from tile at x, y if it has one.
+
+        :param x: coord x
+        :param y: coord y
+        :return:
+        """
+        if self.__hint_levels[y][x] != 0:
+            self.__hint_levels[y][x] = 0
+            self.__tile_grid[y][x].set_rest_color(Color.MID_TONE)
+
     def clear_tiles(self):
         """Set all tile images to blank.
 
@@ -215,11 +304,15 @@ class TileGrid(Frame):
     def set_tile_marker(self, x, y, marker):
         """Set tile image at coordinates x, y by enum MarkerType.
 
+        Occupied tiles are never shaded, so placing a marker drops the shade.
+
         :param x: coord x
         :param y: coord y
         :param marker: MarkerType marker to set tile image to
         :return:
         """
+        if marker is not MarkerType.NONE:
+            self.__clear_hint(x, y)
         self.__tile_grid[y][x].configure(image=self.__marker_images[marker])
 
 
@@ -338,6 +431,9 @@ class Application:
             Clear game board contents and start new game.
             Should only be called when the game has ended.
 
+        Application.toggle_hints() -> void
+            Turn move-suggestion shading of empty tiles on or off.
+
         Application.loop() -> void
             Start UI loop.
 
@@ -355,6 +451,7 @@ class Application:
         self.__root.title("Ristinolla")
         self.__root.resizable(width=False, height=False)
         self.__root.configure(bg=Color.MID_TONE)
+        self.__root.bind("<h>", lambda _e: self.toggle_hints())
 
         # Interface components
         self.__infobar = InfoBar(self.__root)
@@ -401,11 +498,15 @@ class Application:
             # Display winner info if found
             if state is GameState.WINNER:
                 self.__infobar.show_results(state, winner, loser)
+                self.__tilegrid.clear_hints()
                 self.__tilegrid.highlight_tiles(win_tiles)
                 self.__buttonbar.set_disabled(False)
             elif state is GameState.TIE:
                 self.__infobar.show_results(state, None, None)
+                self.__tilegrid.clear_hints()
                 self.__buttonbar.set_disabled(False)
+            else:
+                self.__tilegrid.update_hints(self.__game.get_hint_scores())
 
             # Play sound according to the player
             if player is MarkerType.CROSS:
@@ -441,6 +542,12 @@ class Application:
             raise PermissionError(
                 "Method reset_board was called while game hasn't ended.")
 
+    def toggle_hints(self):
+        """Turn move-suggestion shading of empty tiles on or off."""
+        self.__tilegrid.set_hint_mode(not self.__tilegrid.get_hint_mode())
+        if self.__game.get_state() is GameState.PLAYING:
+            self.__tilegrid.update_hints(self.__game.get_hint_scores())
+
     def loop(self):
         """Start UI loop."""
         self.__root.mainloop()
@@ -464,6 +571,9 @@ class Game:
             winner, loser, win_tiles (list of tuples (x, y)). In the case of
             tie, return GameState.TIE. Gives turn to the next player if still
             playing.
+
+        Game.get_hint_scores() -> list[SIZE_Y][SIZE_X]
+            Return move-suggestion scores of all tiles for the current player.
     """
     def __init__(self):
         """Create game grid and set initial values."""
@@ -478,6 +588,10 @@ class Game:
         # Separate counter for turns, because __turn depends on starting player
         self.__turns_played = 0
 
+        # Move-suggestion scores, updated around each move
+        self.__heatmap = HeatMap(
+            (MarkerType.CROSS, MarkerType.CIRCLE), MarkerType.NONE)
+
     def check_move(self, mark, move_x, move_y):
         """Returns relevant tiles and winner if found IN_A_ROW amount of marks.
 
@@ -544,6 +658,7 @@ class Game:
             for x in range(Settings.SIZE_X):
                 self.__grid[y][x] = MarkerType.NONE
 
+        self.__heatmap.reset()
         self.__state = GameState.PLAYING
 
     def get_player(self):
@@ -571,6 +686,13 @@ class Game:
             return MarkerType.NONE
         return self.__grid[y][x]
 
+    def get_hint_scores(self):
+        """Return move-suggestion scores of all tiles for the current player.
+
+        :return: list[SIZE_Y][SIZE_X] of int scores, see HeatMap
+        """
+        return self.__heatmap.get_scores(self.get_player())
+
     def get_state(self):
         """Return game state: GameState
 
@@ -608,6 +730,7 @@ class Game:
         """
         player = self.get_player()
         self.__grid[y][x] = player
+        self.__heatmap.place(x, y, player)
 
         winner, win_tiles = self.check_move(self.get_player(), x, y)
 
@@ -11,6 +11,7 @@ class Settings:
     SIZE_X = 12
     SIZE_Y = 12
     IN_A_ROW = 5  # How many marks in a row to win
+    HINTS = False  # Shade empty tiles by move suggestion, toggle with 'h'
 
 
 class Pad:
@@ -28,3 +29,8 @@ class Color:
     WIN_COLOR = "#FFCC33"
 
     BLACK = "#000000"
+
+    # Hint shades by heatmap.hint_level, the last one for every level above.
+    # Top shade marks a tile completing a window or crossing strong lines.
+    # Darker than MID_TONE, so the lighter HIGH_TONE hover still stands out.
+    HINT_TONES = (MID_TONE, "#E03434", "#C02828", "#A01C1C", "#801010")